@@ -1,6 +1,11 @@
+import asyncio
+import contextlib
 import pathlib
+import sqlite3
+import threading
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from modal import App, Image, Secret, Volume
 
 DB_FILENAME = "template.db"
@@ -8,13 +13,90 @@ VOLUME_DIR = "/cache-vol"
 DB_PATH = pathlib.Path(VOLUME_DIR, DB_FILENAME)
 volume = Volume.from_name("sqlite-db-vol", create_if_missing=True)
 
+def get_db_conn() -> sqlite3.Connection:
+    """Open a connection to the shared SQLite database with tuned PRAGMAs."""
+    # 10s busy timeout (double the default): bulk inserts can hold the write
+    # lock for a while, and readers should wait them out rather than fail.
+    conn = sqlite3.connect(
+        DB_PATH, timeout=10.0, cached_statements=256, check_same_thread=False
+    )
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")
+    return conn
+
+_local = threading.local()
+
+def get_db() -> sqlite3.Connection:
+    """Return this thread's long-lived connection, opening it on first use.
+
+    Reusing one connection per thread keeps SQLite's page cache warm across
+    requests instead of rebuilding it on every sqlite3.connect.
+    """
+    if not hasattr(_local, "conn"):
+        _local.conn = get_db_conn()
+    return _local.conn
+
+_COMMIT_DELAY_SECONDS = 1.0
+_commit_task: asyncio.Task | None = None
+_commit_dirty = False
+
+async def _delayed_commit() -> None:
+    # Keep committing until no write has arrived since the last commit, so a
+    # write that lands while a commit is in flight is never silently dropped.
+    # The dirty flag stays set through the debounce sleep and is restored if
+    # the commit fails, so pending state survives cancellation and errors.
+    global _commit_dirty
+    while _commit_dirty:
+        await asyncio.sleep(_COMMIT_DELAY_SECONDS)
+        _commit_dirty = False
+        try:
+            await asyncio.to_thread(volume.commit)
+        except Exception:
+            _commit_dirty = True
+            raise
+
+def schedule_volume_commit() -> None:
+    """Commit the volume at most once per second, coalescing bursts of writes.
+
+    volume.commit() is a network round trip to Modal's shared storage, so the
+    write endpoints schedule it in the background instead of paying for it
+    inline on every request. Note that SQLite commits only reach the
+    container-local mount; nothing is durable in Modal storage until
+    volume.commit() runs, which is why the lifespan hook below flushes any
+    commit still pending at shutdown.
+    """
+    global _commit_task, _commit_dirty
+    _commit_dirty = True
+    if _commit_task is None or _commit_task.done():
+        _commit_task = asyncio.get_running_loop().create_task(_delayed_commit())
+
+async def _flush_volume_commit() -> None:
+    """Commit any write still waiting in the debounce window."""
+    global _commit_dirty
+    if _commit_task is not None and not _commit_task.done():
+        _commit_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await _commit_task
+    if _commit_dirty:
+        _commit_dirty = False
+        await asyncio.to_thread(volume.commit)
+
 image = Image.debian_slim().pip_install_from_pyproject("pyproject.toml")
 secrets = Secret.from_dotenv()
 
 app = App(name="starter_template", secrets=[secrets], image=image)
 
+@contextlib.asynccontextmanager
+async def _lifespan(_: FastAPI):
+    yield
+    # Flush the debounced volume commit so a write landing just before the
+    # container scales down is not lost with the local mount.
+    await _flush_volume_commit()
+
 # Create a FastAPI instance here so it can be shared across modules
-fastapi_app = FastAPI()
+fastapi_app = FastAPI(default_response_class=ORJSONResponse, lifespan=_lifespan)
 
 # Configure CORS
 
@@ -1,6 +1,56 @@
+import asyncio
 import sqlite3
+
+import orjson
+from fastapi.responses import StreamingResponse
 from modal import asgi_app
-from .common import DB_PATH, VOLUME_DIR, app, fastapi_app, volume
+from pydantic import BaseModel, ConfigDict
+from .common import (
+    VOLUME_DIR,
+    app,
+    fastapi_app,
+    get_db,
+    get_db_conn,
+    schedule_volume_commit,
+    volume,
+)
+
+class BulkItems(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    names: list[str]
+
+# Hot-path SQL lives here so every call binds the same string and hits the
+# connection's statement cache instead of re-parsing per request.
+_INSERT_ITEM_SQL = "INSERT INTO items (name) VALUES (?)"
+_LIST_ITEMS_SQL = "SELECT * FROM items"
+
+# Blocking SQLite work lives in plain functions so the async handlers can push
+# it onto a worker thread instead of stalling the event loop.
+def _insert_items(names: list[str]) -> None:
+    conn = get_db()
+    with conn:
+        conn.executemany(_INSERT_ITEM_SQL, [(name,) for name in names])
+
+def _iter_items_json():
+    """Yield the items payload one JSON chunk at a time.
+
+    Rows stream straight off the cursor, so peak memory stays flat no matter
+    how large the table grows. Starlette iterates sync generators in a thread
+    pool, which also keeps the cursor work off the event loop.
+    """
+    cursor = get_db().cursor()
+    cursor.row_factory = sqlite3.Row
+    cursor.execute(_LIST_ITEMS_SQL)
+    yield '{"items": ['
+    first = True
+    for row in cursor:
+        prefix = "" if first else ","
+        first = False
+        yield prefix + orjson.dumps(
+            {"id": row["id"], "name": row["name"], "created_at": row["created_at"]}
+        ).decode()
+    yield "]}"
 
 @app.function(
     volumes={VOLUME_DIR: volume},
@@ -8,55 +58,52 @@ from .common import DB_PATH, VOLUME_DIR, app, fastapi_app, volume
 def init_db():
     """Initialize the SQLite database with a simple table."""
     volume.reload()
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+    conn = get_db_conn()
     # Create a simple table
-    cursor.execute(
+    with conn:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
         """
-        CREATE TABLE IF NOT EXISTS items (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
-    """
-    )
-    conn.commit()
+        # Refresh planner statistics for the query planner
+        conn.execute("ANALYZE")
     conn.close()
     volume.commit()
 
 @app.function(
     volumes={VOLUME_DIR: volume},
+    keep_warm=1,
+    container_idle_timeout=300,
 )
 @asgi_app()
 def fastapi_entrypoint():
     # Initialize database on startup
     init_db.remote()
+    # init_db runs in a separate container; pick up its commit before serving
+    volume.reload()
     return fastapi_app
 
+@fastapi_app.post("/items/bulk")
+async def create_items_bulk(items: BulkItems):
+    # executemany reuses the parsed statement across all rows and commits once
+    await asyncio.to_thread(_insert_items, items.names)
+    schedule_volume_commit()
+    return {"message": f"Added {len(items.names)} items"}
+
 @fastapi_app.post("/items/{name}")
 async def create_item(name: str):
-    volume.reload()
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    cursor.execute("INSERT INTO items (name) VALUES (?)", (name,))
-    conn.commit()
-    conn.close()
-    volume.commit()
+    await asyncio.to_thread(_insert_items, [name])
+    schedule_volume_commit()
     return {"message": f"Added item: {name}"}
 
 @fastapi_app.get("/items")
 async def list_items():
-    volume.reload()
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM items")
-    items = cursor.fetchall()
-    conn.close()
-    return {
-        "items": [
-            {"id": item[0], "name": item[1], "created_at": item[2]} for item in items
-        ]
-    }
+    return StreamingResponse(_iter_items_json(), media_type="application/json")
 
 @fastapi_app.get("/")
 def read_root():